@@ -0,0 +1,66 @@
+"""
+Track the cold import time of goodjson.
+
+Runs `python -X importtime -c "import goodjson.validators"` in fresh interpreters and reports
+the median cumulative import time (in microseconds) of each goodjson module, as well as the
+heaviest third-party or standard library modules pulled in along the way.
+
+Usage: python benchmarks/import_time.py [--runs 20] [--module goodjson.validators] [--top 10]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_once(module: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Import the module in a fresh interpreter and parse its "-X importtime" report into
+    {module name: (self time, cumulative time)}.
+    """
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        stderr=subprocess.PIPE, universal_newlines=True, env=env, check=True)
+
+    timings = dict()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--module', default='goodjson.validators')
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    cumulative = defaultdict(list)
+    for _ in range(args.runs):
+        for name, (_, cumulative_us) in run_once(args.module).items():
+            cumulative[name].append(cumulative_us)
+
+    medians = {name: statistics.median(values) for name, values in cumulative.items()}
+    own = sorted((name for name in medians if name.split('.')[0] == 'goodjson'), key=medians.get, reverse=True)
+    others = sorted((name for name in medians if name not in own), key=medians.get, reverse=True)
+
+    print(f'median cumulative import time over {args.runs} runs')
+    for name in own:
+        print(f'{medians[name]:>10.0f} us  {name}')
+    print('-' * 40)
+    for name in others[:args.top]:
+        print(f'{medians[name]:>10.0f} us  {name}')
+
+
+if __name__ == '__main__':
+    main()
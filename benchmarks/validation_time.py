@@ -0,0 +1,54 @@
+"""
+Track the validation throughput of the higher order validators.
+
+Times a few representative schemas with timeit and reports the best of several repeats.
+
+Usage: python benchmarks/validation_time.py [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import timeit
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from goodjson.validators import foreach, foreach_key, is_integer, is_positive
+
+
+def foreach_ints() -> Tuple[Callable, int]:
+    validate_fn = foreach(is_integer, is_positive)
+    data = list(range(1, 200001))
+    return lambda: validate_fn(data), 1
+
+
+def foreach_key_valid_dict() -> Tuple[Callable, int]:
+    keys = [f'field{i}' for i in range(20)]
+    validate_fn = foreach_key(OPTIONAL_KEYS=keys[-2:], **{key: [is_integer] for key in keys})
+    data = {key: i for i, key in enumerate(keys)}
+    return lambda: validate_fn(data), 20000
+
+
+def foreach_key_missing_key() -> Tuple[Callable, int]:
+    keys = [f'field{i}' for i in range(20)]
+    validate_fn = foreach_key(**{key: [is_integer] for key in keys})
+    data = {key: i for i, key in enumerate(keys[:-1])}
+    return lambda: validate_fn(data), 20000
+
+
+CASES = [foreach_ints, foreach_key_valid_dict, foreach_key_missing_key]
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    for case in CASES:
+        run, number = case()
+        best = min(timeit.repeat(run, number=number, repeat=args.repeat))
+        print(f'{best:>10.4f} s  {case.__name__} ({number} calls)')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,7 @@
 from datetime import datetime
 from goodjson.validators import \
-    foreach, foreach_key, is_between, is_categorical, is_datetime, is_list, is_positive, \
-    is_string, is_float, is_integer, gj_all
+    foreach, foreach_key, foreach_sampled, foreach_entry, is_between, is_categorical, is_datetime, is_list, is_positive, \
+    is_string, is_float, is_integer, gj_all, select_paths
 
 
 """
@@ -112,3 +112,64 @@ print(validate_fn({
         }
     }
 }))
+
+
+"""
+Example:
+
+Check a very large list by validating a reproducible random sample of its elements
+"""
+readings = [float(i) for i in range(100000)]
+readings[10] = None
+readings[-1] = 'NaN'
+
+validate_fn = foreach_sampled(is_float, rate=0.01, seed=0)
+
+print(validate_fn(readings))
+
+
+"""
+Example:
+
+Only validate the selected paths of a schema, skipping everything else.
+Build the restricted validator once and reuse it.
+"""
+files_schema = foreach_key(
+    files=[
+        is_list(),
+        foreach(foreach_key(
+            filename=[is_string],
+            size=[is_integer, is_positive]
+        ))
+    ],
+    owner=[is_string]
+)
+
+validate_fn = select_paths(files_schema, ['_root_$files$*$size'])
+
+print(validate_fn({
+    'files': [
+        {'size': 128},
+        {'filename': 'notes', 'size': -1}
+    ]
+}))
+
+
+"""
+Example:
+
+Check a dict used as a map of SKU to product records, rejecting unexpected record fields
+"""
+validate_fn = foreach_entry(
+    key_validators=[is_string],
+    value_validators=[foreach_key(
+        STRICT=True,
+        name=[is_string],
+        price=[is_float, is_positive]
+    )]
+)
+
+print(validate_fn({
+    'sku.1': {'name': 'pen', 'price': 1.5},
+    'sku.2': {'name': 'ink', 'price': 3.0, 'colour': 'blue'}
+}))
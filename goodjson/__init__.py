@@ -1 +1,2 @@
 ROOT_SYMBOL = '_root_'
+KEY_SYMBOL = '_key_'
@@ -95,3 +95,10 @@ not_ending_with = ErrorMessage(
 empty_value = ErrorMessage(
     'empty_value',
     'value is empty')
+sampled_failures = ErrorMessage(
+    'sampled_failures',
+    'found {failures} invalid elements, estimated failure rate {failure_rate:.2%} '
+    '({lower:.2%} ~ {upper:.2%}) from {sample_size} sampled elements')
+unexpected_key = ErrorMessage(
+    'unexpected_key',
+    '{object} is not expected')
@@ -1,5 +1,8 @@
-from typing import Any, Callable, Tuple, Optional, TypeVar, Union
-from typing_extensions import TypedDict
+from typing import Any, Callable, Dict, Tuple, Optional, TypeVar, Union
+try:
+    from typing import TypedDict
+except ImportError:  # Python < 3.8
+    from typing_extensions import TypedDict
 from .errors import ErrorMessage
 
 
@@ -39,3 +42,11 @@ some data failed to pass a test
 ValidatorReturn = InformativeCheckerReturn[ValidationFail]
 
 ValidatorFunction = Callable[..., ValidatorReturn]
+
+
+"""
+Path index is a trie of "$"-delimited JSON paths (see ValueAndPath), mapping each path entry
+(a dict key, a list index or "*" for any of them) to the index of the entries below it.
+An empty index marks the end of a path, i.e. the whole subtree is selected.
+"""
+PathIndex = Dict[str, Any]
@@ -1,4 +1,8 @@
-from typing import Any, Iterable, List, Tuple
+import math
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from goodjson import ROOT_SYMBOL
+from goodjson.types import PathIndex
 
 
 def flatten(container: Iterable):
@@ -35,3 +39,71 @@ def get_matrix_size(mat: List[Any]) -> Tuple[int, ...]:
         return (N,)
 
     return (N,) + get_matrix_size(mat[0])
+
+
+def wilson_interval(successes: int, trials: int, z: float = 1.96) -> Tuple[float, float]:
+    """
+    Wilson score interval of a binomial proportion. The default z value gives
+    a two-sided 95% confidence interval.
+    """
+    if trials == 0:
+        return 0., 1.
+
+    p = successes / trials
+    denominator = 1 + z ** 2 / trials
+    centre = p + z ** 2 / (2 * trials)
+    spread = z * math.sqrt(p * (1 - p) / trials + z ** 2 / (4 * trials ** 2))
+    return max(0., (centre - spread) / denominator), min(1., (centre + spread) / denominator)
+
+
+def build_path_index(paths: Iterable[str]) -> PathIndex:
+    """
+    Compile "$"-delimited path patterns such as "_root_$files$*$size" into a PathIndex.
+    """
+    paths = list(paths)
+    assert paths, 'at least one path is required'
+
+    index: PathIndex = dict()
+    for path in paths:
+        root, *entries = path.split('$')
+        if root != ROOT_SYMBOL:
+            raise ValueError(f'path "{path}" does not start with {ROOT_SYMBOL}')
+        if not entries:
+            # the whole data is selected
+            return dict()
+
+        node = index
+        for entry in entries[:-1]:
+            if node.get(entry) == dict():
+                # an ancestor is already selected as a whole
+                break
+            node = node.setdefault(entry, dict())
+        else:
+            node[entries[-1]] = dict()
+    return index
+
+
+def merge_path_index(*indices: Optional[PathIndex]) -> Optional[PathIndex]:
+    """
+    Union several path indices, skipping None. Returns None if all indices are None.
+    """
+    indices = [index for index in indices if index is not None]
+    if not indices:
+        return None
+    if any(index == dict() for index in indices):
+        return dict()
+
+    merged: PathIndex = dict()
+    for entry in set().union(*indices):
+        merged[entry] = merge_path_index(*(index.get(entry) for index in indices))
+    return merged
+
+
+def iter_path_patterns(index: PathIndex, prefix: str = ROOT_SYMBOL) -> Iterator[str]:
+    """
+    Yield the full path patterns compiled into a PathIndex, the reverse of `build_path_index`.
+    """
+    if index == dict():
+        yield prefix
+    for entry, sub_index in index.items():
+        yield from iter_path_patterns(sub_index, prefix + '$' + entry)
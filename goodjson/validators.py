@@ -1,14 +1,13 @@
 import re
+import math
 import operator
-import validators as validators_util
-from datetime import datetime
 from functools import partial
 from enum import Enum
-from typing import List, Tuple, Union, Dict, Any, Type, Set
+from typing import List, Tuple, Union, Dict, Any, Type, Set, FrozenSet
 
-from goodjson import errors, exceptions, utils, ROOT_SYMBOL
+from goodjson import errors, exceptions, utils, ROOT_SYMBOL, KEY_SYMBOL
 from goodjson.types import \
-    Number, CheckerReturn, ValidatorFunction, ValidatorReturn
+    Number, CheckerReturn, ValidatorFunction, ValidatorReturn, ValidationFail, PathIndex
 from goodjson.decorators import validator
 
 
@@ -52,11 +51,13 @@ def is_uuid(value: str):
 
 @validator(errors.not_type.format(type='URI'))
 def is_uri(value: str):
+    import validators as validators_util
     return isinstance(value, str) and validators_util.url(value) is True
 
 
 @validator(errors.not_type.format(type='email'))
 def is_email(value: str):
+    import validators as validators_util
     return isinstance(value, str) and validators_util.email(value) is True
 
 
@@ -70,6 +71,8 @@ def is_of_type(types: Union[Type, Tuple[Type]], type_name: str) -> ValidatorFunc
 
 
 def is_datetime(pattern: str) -> ValidatorFunction:
+    from datetime import datetime
+
     @validator(errors.not_type.format(type=f'datetime string of pattern "{pattern}"'))
     def inner(value: str) -> CheckerReturn:
         try:
@@ -80,9 +83,9 @@ def is_datetime(pattern: str) -> ValidatorFunction:
     return inner
 
 
-def is_list(size=None) -> ValidatorFunction:
+def is_list(size=None, types: Union[Type, Tuple[Type]] = list) -> ValidatorFunction:
     assert type(size) in (int, type(None), tuple)
-    type_name = 'list'
+    type_name = ' or '.join(t.__name__ for t in utils.force_tuple(types))
 
     if isinstance(size, int):
         assert size > 0, 'list size must be positive'
@@ -94,7 +97,7 @@ def is_list(size=None) -> ValidatorFunction:
     @validator(errors.not_type.format(type=type_name))
     def inner(value: Any) -> CheckerReturn:
 
-        if not isinstance(value, list):
+        if not isinstance(value, types):
             return False
         if isinstance(size, int):
             return size == len(value)
@@ -160,6 +163,37 @@ def is_categorical(options: Union[Enum, List, Set], ignore_none=False) -> Valida
 
 # -----------------------
 # Higher-order validators
+def _locate(val_fail: ValidationFail, entry: Union[int, str]) -> ValidationFail:
+    """
+    Prefix the path of a failure with the index or key of the value it was found in,
+    including the element failures collected by `foreach_sampled`.
+    """
+    loc = val_fail['data']['path'].replace(ROOT_SYMBOL, '')
+    val_fail['data']['path'] = ROOT_SYMBOL + '$' + str(entry) + loc
+
+    if val_fail['error'].name == errors.sampled_failures.name:
+        for element_fail in val_fail['data']['value']:
+            _locate(element_fail, entry)
+    return val_fail
+
+
+def _validate_element(validators: Tuple[ValidatorFunction, ...],
+                      entry: Union[int, str],
+                      element: Any) -> ValidatorReturn:
+    """
+    Apply a sequence of validators to one list element or dict value, locating any failure
+    at its index or key.
+    """
+    try:
+        for validate_fn in validators:
+            ok, val_fail = validate_fn(element)
+            if not ok:
+                return ok, _locate(val_fail, entry)
+    except exceptions.ValueNotRequired:
+        pass
+    return True, None
+
+
 def foreach(*validators: ValidatorFunction) -> ValidatorFunction:
     """
     Apply a sequence of validators to each element in a list or tuple.
@@ -179,19 +213,114 @@ def foreach(*validators: ValidatorFunction) -> ValidatorFunction:
                 for validate_fn in validators:
                     ok, val_fail = validate_fn(element)
                     if not ok:
-                        loc = val_fail['data']['path'].replace(ROOT_SYMBOL, '')
-                        val_fail['data']['path'] = ROOT_SYMBOL + '$' + str(idx) + loc
-                        return ok, val_fail
+                        return ok, _locate(val_fail, idx)
             except exceptions.ValueNotRequired:
                 pass
         return True, None
+
+    inner.element_validators = validators
     return inner
 
 
-def foreach_key(OPTIONAL_KEYS=tuple(), **key_validators_pairs: List[ValidatorFunction]) -> ValidatorFunction:
+def foreach_sampled(*validators: ValidatorFunction,
+                    rate: float,
+                    seed: Any = 0,
+                    size=None,
+                    z: float = 1.96) -> ValidatorFunction:
+    """
+    Apply a sequence of validators to a random subset of a list or tuple, plus its first and
+    last elements. The subset is drawn from `seed`, so the same elements are checked on every
+    call unless another seed is given. The type and `size` (as in `is_list`) of the list itself
+    are always checked.
+
+    Fails with all invalid elements found (paths carry their real indices), the failure rate
+    estimated from the random subset and its Wilson confidence interval, where `z` is the
+    normal quantile of the confidence level.
+    """
+    import random
+
+    assert 0 < rate <= 1, 'sampling rate must be within (0, 1]'
+    check_structure = is_list(size, types=(list, tuple))
+
+    def inner(value: Union[List, Tuple]) -> ValidatorReturn:
+        ok, val_fail = check_structure(value)
+        if not ok:
+            return ok, val_fail
+
+        N = len(value)
+        if N == 0:
+            return True, None
+
+        sample_size = min(N, max(1, math.ceil(N * rate)))
+        sampled = set(random.Random(seed).sample(range(N), sample_size))
+
+        failures = []
+        sample_failures = 0
+        for idx in sorted(sampled.union((0, N - 1))):
+            ok, val_fail = _validate_element(validators, idx, value[idx])
+            if not ok:
+                failures.append(val_fail)
+                sample_failures += idx in sampled
+
+        if not failures:
+            return True, None
+
+        lower, upper = utils.wilson_interval(sample_failures, sample_size, z)
+        return False, {
+            'error': errors.sampled_failures.format(
+                failures=len(failures),
+                sample_size=sample_size,
+                failure_rate=sample_failures / sample_size,
+                lower=lower,
+                upper=upper),
+            'data': {
+                'path': ROOT_SYMBOL,
+                'value': failures
+            }
+        }
+    return inner
+
+
+def _key_set_fail(value: Dict[str, Any],
+                  key_validators_pairs: Dict[str, List[ValidatorFunction]],
+                  required_keys: FrozenSet[str],
+                  allowed_keys: FrozenSet[str]) -> ValidationFail:
+    """
+    Report the first missing key in schema order, or else the first unexpected key.
+    """
+    if not required_keys <= value.keys():
+        missing_key = next(key for key in key_validators_pairs if key in required_keys and key not in value)
+        return {
+            'error': errors.not_found.format(object=missing_key),
+            'data': {
+                'path': ROOT_SYMBOL,
+                'value': value
+            }
+        }
+
+    unexpected_key = next(key for key in value if key not in allowed_keys)
+    return {
+        'error': errors.unexpected_key.format(object=unexpected_key),
+        'data': {
+            'path': ROOT_SYMBOL + '$' + str(unexpected_key),
+            'value': value[unexpected_key]
+        }
+    }
+
+
+def foreach_key(OPTIONAL_KEYS=tuple(),
+                STRICT=False,
+                **key_validators_pairs: List[ValidatorFunction]) -> ValidatorFunction:
     """
     For each key and its given validators, apply them to the corresponding value.
+    In strict mode, keys without validators are rejected.
     """
+    allowed_keys = frozenset(key_validators_pairs)
+    required_keys = allowed_keys.difference(OPTIONAL_KEYS)
+    # Once required keys are known to exist, only optional keys need a membership test
+    key_validators_optional = tuple(
+        (key, validators, key in OPTIONAL_KEYS) for key, validators in key_validators_pairs.items())
+
     def inner(value: Dict[str, Any]) -> ValidatorReturn:
         if not isinstance(value, dict):
             return False, {
@@ -202,34 +331,86 @@ def foreach_key(OPTIONAL_KEYS=tuple(), **key_validators_pairs: List[ValidatorFun
                 }
             }
 
-        for key, validators in key_validators_pairs.items():
-            # Ensure the key exists
-            if key not in value:
-                if key not in OPTIONAL_KEYS:
-                    return False, {
-                        'error': errors.not_found.format(object=key),
-                        'data': {
-                            'path': ROOT_SYMBOL,
-                            'value': value
-                        }
-                    }
+        # Ensure the keys exist, and nothing else in strict mode
+        if not required_keys <= value.keys() or (STRICT and not value.keys() <= allowed_keys):
+            return False, _key_set_fail(value, key_validators_pairs, required_keys, allowed_keys)
+
+        # Apply validators
+        for key, validators, optional in key_validators_optional:
+            if optional and key not in value:
                 continue
 
-            # Apply validators
             try:
                 for validate_fn in validators:
                     ok, val_fail = validate_fn(value[key])
                     if not ok:
-                        loc = val_fail['data']['path'].replace(ROOT_SYMBOL, '')
-                        val_fail['data']['path'] = ROOT_SYMBOL + '$' + key + loc
-                        return ok, val_fail
+                        return ok, _locate(val_fail, key)
 
             except exceptions.ValueNotRequired:
                 pass
         return True, None
+
+    inner.key_validators = key_validators_pairs
+    inner.optional_keys = OPTIONAL_KEYS
+    return inner
+
+
+def _foreach_entry_at(key_validators: List[ValidatorFunction],
+                      keyed_validators: Dict[str, List[ValidatorFunction]],
+                      default_validators: List[ValidatorFunction] = None) -> ValidatorFunction:
+    """
+    Apply key validators to each key of a dict, and value validators to its value. Values of
+    the given keys have their own validators, other values are checked by the default
+    validators, or skipped along with their keys if there are none.
+    """
+    def inner(value: Dict[str, Any]) -> ValidatorReturn:
+        if not isinstance(value, dict):
+            return False, {
+                'error': errors.not_type.format(type='dict'),
+                'data': {
+                    'path': ROOT_SYMBOL,
+                    'value': value
+                }
+            }
+
+        if default_validators is None:
+            entries = ((key, value[key]) for key in keyed_validators if key in value)
+        else:
+            entries = value.items()
+
+        for key, element in entries:
+            # Key failures are located under the key symbol to tell them from value failures
+            ok, val_fail = _validate_element(key_validators, f'{key}${KEY_SYMBOL}', key)
+            if not ok:
+                return ok, val_fail
+
+            validators = keyed_validators.get(key, default_validators)
+            ok, val_fail = _validate_element(validators, key, element)
+            if not ok:
+                return ok, val_fail
+        return True, None
     return inner
 
 
+def foreach_entry(key_validators: List[ValidatorFunction] = tuple(),
+                  value_validators: List[ValidatorFunction] = tuple()) -> ValidatorFunction:
+    """
+    Apply a sequence of validators to each key of a dict used as a map, and another sequence
+    to each value. Key failures are located at "<key>$_key_" below the dict, value failures
+    at "<key>".
+    """
+    inner = _foreach_entry_at(key_validators, dict(), value_validators)
+    inner.entry_validators = (key_validators, value_validators)
+    return inner
+
+
+def foreach_value(*validators: ValidatorFunction) -> ValidatorFunction:
+    """
+    Apply a sequence of validators to each value of a dict used as a map.
+    """
+    return foreach_entry(value_validators=validators)
+
+
 def gj_all(*validators: ValidatorFunction) -> ValidatorFunction:
     def inner(value: Any) -> ValidatorReturn:
         for validate_fn in validators:
@@ -237,9 +418,177 @@ def gj_all(*validators: ValidatorFunction) -> ValidatorFunction:
             if not ok:
                 return ok, val_fail
         return True, None
+
+    inner.all_validators = validators
+    return inner
+
+
+# --------------------
+# Selective validation
+def _foreach_at(indexed_validators: Dict[int, List[ValidatorFunction]],
+                default_validators: List[ValidatorFunction] = None) -> ValidatorFunction:
+    """
+    Like foreach but apply different validators to the given indices. Other elements are
+    checked by the default validators, or skipped if there are none. Indices beyond the list
+    are ignored.
+    """
+    def inner(value: Union[List, Tuple]) -> ValidatorReturn:
+        if type(value) not in (list, tuple):
+            return False, {
+                'error': errors.not_type.format(type='list or tuple'),
+                'data': {
+                    'path': '',
+                    'value': value
+                }
+            }
+
+        if default_validators is None:
+            indices = (idx for idx in sorted(indexed_validators) if idx < len(value))
+        else:
+            indices = range(len(value))
+
+        for idx in indices:
+            validators = indexed_validators.get(idx, default_validators)
+            ok, val_fail = _validate_element(validators, idx, value[idx])
+            if not ok:
+                return ok, val_fail
+        return True, None
     return inner
 
 
+def _restrict_keys(validate_fn: ValidatorFunction, index: PathIndex) -> ValidatorFunction:
+    star = index.get('*')
+    key_validators_pairs = dict()
+    for key, validators in validate_fn.key_validators.items():
+        sub_index = utils.merge_path_index(star, index.get(key))
+        if sub_index is not None:
+            key_validators_pairs[key] = [_restrict(fn, sub_index) for fn in validators]
+    # Unselected keys are skipped, so they cannot be rejected in strict mode either
+    return foreach_key(OPTIONAL_KEYS=validate_fn.optional_keys, **key_validators_pairs)
+
+
+def _restrict_entries(validate_fn: ValidatorFunction, index: PathIndex) -> ValidatorFunction:
+    key_validators, value_validators = validate_fn.entry_validators
+    star = index.get('*')
+    keyed_validators = {
+        entry: [_restrict(fn, utils.merge_path_index(star, sub_index)) for fn in value_validators]
+        for entry, sub_index in index.items() if entry != '*'
+    }
+    default_validators = None
+    if star is not None:
+        default_validators = [_restrict(fn, star) for fn in value_validators]
+    return _foreach_entry_at(key_validators, keyed_validators, default_validators)
+
+
+def _restrict_elements(validate_fn: ValidatorFunction, index: PathIndex) -> ValidatorFunction:
+    star = index.get('*')
+    indexed_validators = {
+        int(entry): [_restrict(fn, utils.merge_path_index(star, sub_index))
+                     for fn in validate_fn.element_validators]
+        for entry, sub_index in index.items() if entry.isdigit()
+    }
+    default_validators = None
+    if star is not None:
+        default_validators = [_restrict(fn, star) for fn in validate_fn.element_validators]
+        if not indexed_validators:
+            return foreach(*default_validators)
+    return _foreach_at(indexed_validators, default_validators)
+
+
+def _restrict_all(validate_fn: ValidatorFunction, index: PathIndex) -> ValidatorFunction:
+    return gj_all(*(_restrict(fn, index) for fn in validate_fn.all_validators))
+
+
+_RESTRICTORS = (
+    ('key_validators', _restrict_keys),
+    ('entry_validators', _restrict_entries),
+    ('element_validators', _restrict_elements),
+    ('all_validators', _restrict_all),
+)
+
+
+def _restrict(validate_fn: ValidatorFunction, index: PathIndex) -> ValidatorFunction:
+    if index == dict():
+        return validate_fn
+
+    for marker, restrict in _RESTRICTORS:
+        if hasattr(validate_fn, marker):
+            return restrict(validate_fn, index)
+
+    # Any other validator checks the selected value as a whole
+    return validate_fn
+
+
+def _reachable_validators(validate_fn: ValidatorFunction, entry: str) -> List[List[ValidatorFunction]]:
+    """
+    Validators applied to the value(s) that a path entry points at, through a higher order validator.
+    """
+    if hasattr(validate_fn, 'key_validators'):
+        if entry == '*':
+            return list(validate_fn.key_validators.values())
+        if entry in validate_fn.key_validators:
+            return [validate_fn.key_validators[entry]]
+        return []
+
+    if hasattr(validate_fn, 'entry_validators'):
+        return [validate_fn.entry_validators[1]]
+
+    if entry == '*' or entry.isdigit():
+        return [validate_fn.element_validators]
+    return []
+
+
+def _unmatched_patterns(validators: List[ValidatorFunction], index: PathIndex, path: str) -> List[str]:
+    """
+    Path patterns of an index (relative to the given path) that reach no validator of a schema.
+    Under "*" of a dict, a pattern only needs to reach the validators of one of its keys.
+    """
+    structural = []
+    pending = list(validators)
+    while pending:
+        validate_fn = pending.pop(0)
+        if hasattr(validate_fn, 'all_validators'):
+            pending.extend(validate_fn.all_validators)
+        elif any(hasattr(validate_fn, marker) for marker, _ in _RESTRICTORS):
+            structural.append(validate_fn)
+
+    if not structural:
+        # Any other validator checks the value as a whole, including the selected paths
+        return []
+
+    unmatched = []
+    for entry, sub_index in index.items():
+        sub_path = path + '$' + entry
+        reachable = [fns for validate_fn in structural for fns in _reachable_validators(validate_fn, entry)]
+        if not reachable:
+            unmatched.extend(utils.iter_path_patterns(sub_index, sub_path))
+            continue
+
+        unmatched_each = [_unmatched_patterns(fns, sub_index, sub_path) for fns in reachable]
+        unmatched.extend(pattern for pattern in unmatched_each[0]
+                         if all(pattern in others for others in unmatched_each[1:]))
+    return unmatched
+
+
+def select_paths(validate_fn: ValidatorFunction, paths: Union[PathIndex, List[str]]) -> ValidatorFunction:
+    """
+    Restrict a validator built from foreach, foreach_key, foreach_entry, foreach_value and gj_all
+    to the given path patterns, e.g. "_root_$files$*$size". Entries not on any selected path are
+    neither traversed nor required, while validators of entries on a selected path still check
+    them as a whole.
+
+    Paths may be precompiled with `utils.build_path_index`. Raises ValueError if a path leads
+    to no validator of the schema. Build the restricted validator once and reuse it.
+    """
+    if not isinstance(paths, dict):
+        paths = utils.build_path_index(paths)
+
+    unmatched = _unmatched_patterns([validate_fn], paths, ROOT_SYMBOL)
+    if unmatched:
+        raise ValueError('paths do not match the schema: ' + ', '.join(f'"{path}"' for path in unmatched))
+    return _restrict(validate_fn, paths)
+
+
 # ----------
 # Shorthands
 is_string = is_of_type(str, 'text')
@@ -0,0 +1,18 @@
+import os
+import subprocess
+import sys
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_heavy_dependencies_are_imported_lazily():
+    code = '; '.join([
+        'import sys',
+        'import goodjson.validators',
+        'print(",".join(name for name in ("validators", "random") if name in sys.modules))',
+    ])
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    proc = subprocess.run([sys.executable, '-c', code],
+                          stdout=subprocess.PIPE, universal_newlines=True, env=env, check=True)
+    assert proc.stdout.strip() == ''
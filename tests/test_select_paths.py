@@ -0,0 +1,175 @@
+import pytest
+
+from goodjson.decorators import validator
+from goodjson.errors import ErrorMessage
+from goodjson.utils import build_path_index
+from goodjson.validators import \
+    foreach, foreach_entry, foreach_key, foreach_value, gj_all, is_dict, is_integer, is_list, \
+    is_optional, is_positive, is_string, select_paths
+
+
+def spy(seen):
+    @validator(ErrorMessage('spy', 'spied'))
+    def inner(value):
+        seen.append(value)
+        return True
+    return inner
+
+
+def make_schema(seen):
+    return foreach_key(
+        OPTIONAL_KEYS=('owner',),
+        files=[
+            is_list(),
+            foreach(foreach_key(
+                filename=[is_string, spy(seen)],
+                size=[is_integer, is_positive]
+            ))
+        ],
+        owner=[is_optional, foreach_key(name=[is_string])],
+        tags=[spy(seen)]
+    )
+
+
+def test_unselected_paths_are_skipped():
+    seen = []
+    validate_fn = select_paths(make_schema(seen), ['_root_$files$*$size'])
+
+    assert validate_fn({'files': [{'size': 1}, {'size': 2}]}) == (True, None)
+    ok, val_fail = validate_fn({'files': [{'size': 1}, {'size': -2}]})
+    assert not ok
+    assert val_fail['data']['path'] == '_root_$files$1$size'
+    assert seen == []
+
+
+def test_selected_subtree_is_validated_as_a_whole():
+    seen = []
+    validate_fn = select_paths(make_schema(seen), ['_root_$files$0'])
+
+    ok, val_fail = validate_fn({'files': [{'filename': 'a', 'size': -1}, {}]})
+    assert not ok
+    assert val_fail['data']['path'] == '_root_$files$0$size'
+    assert seen == ['a']
+
+
+def test_indices_with_star():
+    seen = []
+    validate_fn = select_paths(make_schema(seen), ['_root_$files$*$size', '_root_$files$1$filename'])
+
+    ok, val_fail = validate_fn({'files': [{'size': 1}, {'size': 2}]})
+    assert not ok
+    assert val_fail['data']['path'] == '_root_$files$1'
+
+    assert validate_fn({'files': [{'size': 1}, {'size': 2, 'filename': 'b'}]}) == (True, None)
+    assert seen == ['b']
+
+
+def test_indices_past_the_end_are_ignored():
+    validate_fn = select_paths(make_schema([]), build_path_index(['_root_$files$5$size']))
+
+    assert validate_fn({'files': [{'size': -1}]}) == (True, None)
+    assert not validate_fn({'files': [{}] * 6})[0]
+
+
+def test_optional_keys():
+    validate_fn = select_paths(make_schema([]), ['_root_$owner$name'])
+
+    assert validate_fn({}) == (True, None)
+    assert validate_fn({'owner': None}) == (True, None)
+    ok, val_fail = validate_fn({'owner': {'name': 1}})
+    assert not ok
+    assert val_fail['data']['path'] == '_root_$owner$name'
+
+
+def test_required_keys_on_selected_paths():
+    validate_fn = select_paths(make_schema([]), ['_root_$files$*$size'])
+
+    ok, val_fail = validate_fn({'tags': []})
+    assert not ok
+    assert str(val_fail['error']) == 'files is not found'
+
+
+def test_gj_all():
+    validate_fn = select_paths(gj_all(is_dict, make_schema([])), ['_root_$files$*$size'])
+
+    assert not validate_fn([])[0]
+    assert not validate_fn({'files': [{'size': -1}]})[0]
+    assert validate_fn({'files': [{'size': 1}]}) == (True, None)
+
+
+@pytest.mark.parametrize('path', [
+    '_root_$file$*$size',
+    '_root_$files$x$size',
+    '_root_$files$-1$size',
+    '_root_$files$*$sizes',
+])
+def test_unmatched_paths_are_rejected(path):
+    with pytest.raises(ValueError, match=path.replace('$', r'\$').replace('*', r'\*')):
+        select_paths(make_schema([]), [path])
+
+
+def test_star_over_keys_needs_one_match():
+    schema = foreach_key(
+        a=[foreach_key(x=[is_string])],
+        b=[foreach_key(y=[is_string])]
+    )
+    select_paths(schema, ['_root_$*$x'])
+
+    with pytest.raises(ValueError):
+        select_paths(schema, ['_root_$b$x'])
+
+
+def make_map_schema(seen):
+    return foreach_entry(
+        key_validators=[is_string, spy(seen)],
+        value_validators=[foreach_key(
+            name=[is_string, spy(seen)],
+            price=[is_integer, is_positive]
+        )]
+    )
+
+
+def test_map_field_of_every_entry():
+    seen = []
+    validate_fn = select_paths(make_map_schema(seen), ['_root_$*$price'])
+
+    assert validate_fn({'sku.1': {'price': 1}, 'sku.2': {'price': 2}}) == (True, None)
+    assert seen == ['sku.1', 'sku.2']
+
+    ok, val_fail = validate_fn({'sku.1': {'price': 1}, 'sku.2': {'price': -2}})
+    assert not ok
+    assert val_fail['data']['path'] == '_root_$sku.2$price'
+
+    ok, val_fail = validate_fn({1: {'price': 1}})
+    assert val_fail['data']['path'] == '_root_$1$_key_'
+
+
+def test_map_specific_key():
+    seen = []
+    validate_fn = select_paths(make_map_schema(seen), ['_root_$sku.2$name'])
+
+    ok, val_fail = validate_fn({'sku.1': {'name': 1}, 'sku.2': {'name': 2}})
+    assert not ok
+    assert val_fail['data']['path'] == '_root_$sku.2$name'
+    assert seen == ['sku.2']
+
+
+def test_map_specific_key_with_star():
+    validate_fn = select_paths(foreach_value(make_map_schema([])), ['_root_$*$sku.2$price', '_root_$a$*'])
+
+    assert validate_fn({'a': {'sku.1': {'price': -1}}, 'b': {'sku.1': {'price': -1}}})[0] is False
+    assert validate_fn({'b': {'sku.1': {'price': -1}, 'sku.2': {'price': 1}}}) == (True, None)
+
+
+def test_map_selected_key_absent():
+    seen = []
+    validate_fn = select_paths(make_map_schema(seen), ['_root_$sku.3$price'])
+
+    assert validate_fn({'sku.1': {'price': -1}}) == (True, None)
+    assert seen == []
+    assert not validate_fn([])[0]
+
+
+def test_map_unmatched_paths_are_rejected():
+    with pytest.raises(ValueError):
+        select_paths(make_map_schema([]), ['_root_$*$weight'])
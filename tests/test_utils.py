@@ -0,0 +1,50 @@
+import pytest
+
+from goodjson.utils import build_path_index, merge_path_index, iter_path_patterns
+
+
+def test_build_path_index():
+    index = build_path_index(['_root_$files$*$size', '_root_$user$birthday'])
+    assert index == {
+        'files': {'*': {'size': {}}},
+        'user': {'birthday': {}}
+    }
+
+
+def test_build_path_index_selects_whole_data():
+    assert build_path_index(['_root_$files$*$size', '_root_']) == {}
+
+
+@pytest.mark.parametrize('paths', [
+    ['_root_$user', '_root_$user$birthday$year'],
+    ['_root_$user$birthday$year', '_root_$user'],
+])
+def test_build_path_index_collapses_prefixes(paths):
+    assert build_path_index(paths) == {'user': {}}
+
+
+def test_build_path_index_rejects_relative_paths():
+    with pytest.raises(ValueError):
+        build_path_index(['files$*$size'])
+
+
+def test_merge_path_index():
+    merged = merge_path_index({'size': {}}, None, {'name': {}, 'size': {'unit': {}}})
+    assert merged == {'size': {}, 'name': {}}
+
+
+def test_merge_path_index_star_with_keys():
+    index = build_path_index(['_root_$files$*$size', '_root_$files$0$name'])
+    files = index['files']
+    assert merge_path_index(files['*'], files['0']) == {'size': {}, 'name': {}}
+    assert merge_path_index(files['*'], files.get('1')) == {'size': {}}
+
+
+def test_merge_path_index_whole_subtree_wins():
+    assert merge_path_index({'size': {}}, {}) == {}
+    assert merge_path_index(None, None) is None
+
+
+def test_iter_path_patterns():
+    paths = ['_root_$files$*$size', '_root_$user']
+    assert sorted(iter_path_patterns(build_path_index(paths))) == sorted(paths)
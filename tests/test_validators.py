@@ -0,0 +1,134 @@
+import random
+
+import pytest
+
+from goodjson.utils import wilson_interval
+from goodjson.validators import \
+    foreach, foreach_entry, foreach_key, foreach_sampled, foreach_value, is_integer, is_optional, \
+    is_positive, is_string
+
+
+def failed_paths(val_fail):
+    return [element_fail['data']['path'] for element_fail in val_fail['data']['value']]
+
+
+def test_foreach_sampled_is_reproducible():
+    data = ['x'] * 1000
+    validate_fn = foreach_sampled(is_integer, rate=0.05, seed=7)
+    sampled = set(random.Random(7).sample(range(1000), 50))
+    expected = [f'_root_${idx}' for idx in sorted(sampled | {0, 999})]
+
+    for _ in range(3):
+        ok, val_fail = validate_fn(data)
+        assert not ok
+        assert failed_paths(val_fail) == expected
+
+
+def test_foreach_sampled_checks_first_and_last():
+    data = ['x'] + list(range(1, 999)) + ['y']
+    ok, val_fail = foreach_sampled(is_integer, rate=0.01)(data)
+
+    assert not ok
+    assert failed_paths(val_fail) == ['_root_$0', '_root_$999']
+    assert [element_fail['data']['value'] for element_fail in val_fail['data']['value']] == ['x', 'y']
+
+
+def test_foreach_sampled_failure_rate_counts_sampled_only():
+    data = ['x'] + list(range(1, 99)) + ['y']
+    sampled = set(random.Random(0).sample(range(100), 10))
+    assert not sampled & {0, 99}
+    ok, val_fail = foreach_sampled(is_integer, rate=0.1, seed=0)(data)
+
+    assert not ok
+    assert val_fail['error'].formatter['failures'] == 2
+    assert val_fail['error'].formatter['sample_size'] == 10
+    assert val_fail['error'].formatter['failure_rate'] == 0.
+
+
+def test_foreach_sampled_passes():
+    assert foreach_sampled(is_integer, rate=0.1)(list(range(1000))) == (True, None)
+    assert foreach_sampled(is_integer, rate=0.1)([]) == (True, None)
+
+
+def test_foreach_sampled_checks_whole_structure():
+    validate_fn = foreach_sampled(is_integer, rate=0.5, size=3)
+
+    assert validate_fn([1, 2, 3]) == (True, None)
+    assert validate_fn((1, 2, 3)) == (True, None)
+    assert not validate_fn([1, 2])[0]
+    assert not validate_fn((1, 2, 3, 4))[0]
+    assert not validate_fn('abc')[0]
+    assert not foreach_sampled(is_integer, rate=0.5)({'a': 1})[0]
+
+    with pytest.raises(AssertionError):
+        foreach_sampled(is_integer, rate=0.5, size=0)
+
+
+def test_foreach_sampled_nested_paths():
+    validate_fn = foreach_key(readings=[foreach_sampled(is_integer, rate=1)])
+    ok, val_fail = validate_fn({'readings': [1, 'x', 2, 'y']})
+
+    assert not ok
+    assert val_fail['data']['path'] == '_root_$readings'
+    assert failed_paths(val_fail) == ['_root_$readings$1', '_root_$readings$3']
+
+    ok, val_fail = foreach(foreach_sampled(is_integer, rate=1))([[1], [1, 'x']])
+    assert failed_paths(val_fail) == ['_root_$1$1']
+
+
+@pytest.mark.parametrize('successes, trials, expected', [
+    (0, 10, (0., 0.2775)),
+    (10, 10, (0.7225, 1.)),
+    (5, 10, (0.2366, 0.7634)),
+    (0, 0, (0., 1.)),
+])
+def test_wilson_interval(successes, trials, expected):
+    assert wilson_interval(successes, trials) == pytest.approx(expected, abs=1e-4)
+
+
+def test_foreach_key_strict():
+    validate_fn = foreach_key(OPTIONAL_KEYS=('b',), STRICT=True, a=[is_integer], b=[is_string])
+
+    assert validate_fn({'a': 1}) == (True, None)
+    ok, val_fail = validate_fn({'a': 1, 'z': 2})
+    assert not ok
+    assert str(val_fail['error']) == 'z is not expected'
+    assert val_fail['data'] == {'path': '_root_$z', 'value': 2}
+
+
+def test_foreach_key_reports_missing_keys_first():
+    validate_fn = foreach_key(a=[is_integer], b=[is_integer], c=[is_integer])
+
+    ok, val_fail = validate_fn({'a': 'x', 'b': 1})
+    assert not ok
+    assert str(val_fail['error']) == 'c is not found'
+    assert val_fail['data']['path'] == '_root_'
+
+
+def test_foreach_value():
+    validate_fn = foreach_value(foreach_key(price=[is_integer, is_positive]))
+
+    assert validate_fn({'sku.1': {'price': 1}, 'sku.2': {'price': 2}}) == (True, None)
+    ok, val_fail = validate_fn({'sku.1': {'price': 1}, 'sku.2': {'price': -2}})
+    assert not ok
+    assert val_fail['data'] == {'path': '_root_$sku.2$price', 'value': -2}
+
+
+def test_foreach_entry_keys():
+    validate_fn = foreach_entry([is_string], [is_integer])
+
+    ok, val_fail = validate_fn({'a': 1, 2: 3})
+    assert not ok
+    assert val_fail['data'] == {'path': '_root_$2$_key_', 'value': 2}
+
+    ok, val_fail = validate_fn({'a': 'b'})
+    assert not ok
+    assert val_fail['data'] == {'path': '_root_$a', 'value': 'b'}
+
+    ok, val_fail = foreach_key(prices=[validate_fn])({'prices': {2: 3}})
+    assert val_fail['data']['path'] == '_root_$prices$2$_key_'
+
+
+def test_foreach_entry_optional_keys():
+    assert foreach_entry([is_optional], [])({None: 1}) == (True, None)
+    assert foreach_entry([], [is_optional, is_integer])({'a': None}) == (True, None)